@@ -1400,8 +1400,8 @@ class ClusterService:
         self._state = ClusterState.from_json(self._load_snapshot())
 
     def _load_snapshot(self) -> Dict[str, Any]:
-        with self.snapshot_path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        from qcat.loader import read_json
+        return read_json(self.snapshot_path)
 
     def _save_snapshot(self) -> None:
         """Save current state to clusters.json."""
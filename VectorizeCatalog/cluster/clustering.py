@@ -15,6 +15,8 @@ from itertools import combinations
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from qcat.loader import read_json
+
 
 def is_likely_alias(safe_name: str) -> bool:
     """Check if a table name is likely an alias rather than a real table.
@@ -547,8 +549,7 @@ def rebuild_clusters_from_catalog(
     if not catalog_path.exists():
         raise FileNotFoundError(f"Catalog file not found: {catalog_path}")
 
-    with catalog_path.open("r", encoding="utf-8") as handle:
-        catalog = json.load(handle)
+    catalog = read_json(catalog_path)
 
     # Step 1: Group procedures by table access patterns (with filtering)
     groups, table_usage, table_display_names, missing_tables, orphaned_tables = gather_procedure_groups(
@@ -1,8 +1,9 @@
 # cluster/llm_intent.py
 from __future__ import annotations
-import os, re, json, requests
+import os, re, json
 from typing import Dict, Optional, Any, List
 from cluster.intents import list_intents, normalize_name
+from qcat.llm import http_session
 
 # =============== LM Studio config ==================
 _LM_URL = os.getenv("CLUSTER_LMSTUDIO_URL", os.getenv("QCAT_LMSTUDIO_URL", "http://127.0.0.1:1234/v1/chat/completions"))
@@ -254,7 +255,7 @@ def _lmstudio_classify(prompt: str) -> Optional[dict]:
             "max_tokens": 256,
             "stream": False,
         }
-        r = requests.post(_LM_URL, json=payload, timeout=_LM_TIMEOUT)
+        r = http_session().post(_LM_URL, json=payload, timeout=_LM_TIMEOUT)
         r.raise_for_status()
         data = r.json()
         txt = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
@@ -6,8 +6,18 @@ Follows the same pattern as cluster/backend.py for consistency.
 Flow: QcatService.execute_text() → qcat.agent.agent_answer() → qcat.llm_intent.classify_intent() → qcat.ops functions
 """
 from __future__ import annotations
-from typing import Dict, Any, Optional, List
-import numpy as np
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def remember(bucket: List[str], name: str) -> None:
+    """Insert name into a sorted, unique session-memory bucket (no-op if present)."""
+    i = bisect_left(bucket, name)
+    if i == len(bucket) or bucket[i] != name:
+        bucket.insert(i, name)
 
 
 class QcatService:
@@ -16,13 +26,13 @@ class QcatService:
     Wraps items + embeddings and provides execute_text() interface.
     """
 
-    def __init__(self, items: List[Dict[str, Any]], emb: np.ndarray):
+    def __init__(self, items: List[Dict[str, Any]], emb: Optional[np.ndarray]):
         """
         Initialize QcatService
 
         Args:
             items: List of catalog items (tables, procedures, views, functions)
-            emb: Embeddings matrix (N x D)
+            emb: Embeddings matrix (N x D), or None (load_items() never loads one)
         """
         self.items = items
         self.emb = emb
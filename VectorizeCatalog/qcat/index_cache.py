@@ -0,0 +1,30 @@
+# VectorizeCatalog/qcat/index_cache.py
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+# Derived indexes per source object (a flat items list, or a catalog dict),
+# keyed by (id(source), index name); the source itself is kept alongside so a
+# recycled id() is never mistaken for a hit.
+# Least recently used entries are evicted beyond _INDEX_CACHE_MAX.
+_INDEX_CACHE_MAX = 32
+_INDEX_CACHE: "OrderedDict[Tuple[int, str], Tuple[Any, Any]]" = OrderedDict()
+_INDEX_CACHE_LOCK = threading.Lock()
+
+def cached_index(items: Any, name: str, build: Callable[[Any], Any]) -> Any:
+    """build(items), computed once per (source object, name) while it stays cached."""
+    key = (id(items), name)
+    with _INDEX_CACHE_LOCK:
+        hit = _INDEX_CACHE.get(key)
+        if hit is not None and hit[0] is items:
+            _INDEX_CACHE.move_to_end(key)
+            return hit[1]
+    # Built outside the lock: builders may themselves call cached_index.
+    value = build(items)
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[key] = (items, value)
+        _INDEX_CACHE.move_to_end(key)
+        while len(_INDEX_CACHE) > _INDEX_CACHE_MAX:
+            _INDEX_CACHE.popitem(last=False)
+    return value
@@ -83,9 +83,9 @@ def normalize_entity_name(name: str) -> str:
     return s
 
 def detect_kind_from_words(text: str) -> Optional[str]:
-    t = text.lower()
+    t = f" {text.lower()} "
     for k, words in KIND_WORDS.items():
         for w in words:
-            if f" {w} " in f" {t} ":
+            if f" {w} " in t:
                 return k
     return None
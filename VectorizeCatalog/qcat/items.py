@@ -1,24 +1,15 @@
 # qcat/items.py
 from __future__ import annotations
 
-import json
-from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 # Import paths
 try:
     from .paths import CATALOG_JSON
+    from .loader import load_catalog
 except ImportError:
     from paths import CATALOG_JSON
-
-def _read_json(p: Path) -> Optional[dict]:
-    """Read JSON file, return None on error."""
-    try:
-        if p and p.exists():
-            return json.loads(p.read_text(encoding="utf-8"))
-    except Exception:
-        pass
-    return None
+    from loader import load_catalog
 
 def _build_indices_from_catalog(catalog: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -58,9 +49,14 @@ def load_items() -> Tuple[Dict[str, Any], Optional[Any]]:
     Load items from catalog.json.
 
     Simplified: Always builds from catalog.json (no pre-built items.json needed).
+    The catalog comes from loader.load_catalog(), which is parsed once per
+    process and shared with relations.py instead of re-reading the file here.
     Returns: (items dict, None) - embeddings always None (not used in current flow)
     """
-    catalog = _read_json(Path(CATALOG_JSON)) or {}
+    try:
+        catalog = load_catalog() or {}
+    except (OSError, ValueError):
+        catalog = {}
     if not catalog:
         raise FileNotFoundError(f"catalog.json not found or empty at {CATALOG_JSON}")
 
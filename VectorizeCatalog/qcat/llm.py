@@ -1,5 +1,5 @@
 from __future__ import annotations
-import os, json, time
+import os, json, time, threading
 from typing import List, Dict, Any, Optional
 
 # Environment (defaults target LM Studio)
@@ -7,14 +7,34 @@ API_BASE   = os.getenv("CHAT_API_BASE", "http://127.0.0.1:1234/v1")
 API_KEY    = os.getenv("CHAT_API_KEY", "lm-studio")
 CHAT_MODEL = os.getenv("CHAT_MODEL",   "qwen2.5-32b-instruct-mlx")
 TIMEOUT_S  = float(os.getenv("CHAT_TIMEOUT", "120"))
+CONNECT_S  = float(os.getenv("CHAT_CONNECT_TIMEOUT", "5"))  # fail fast when LM Studio is down
 TEMP       = float(os.getenv("CHAT_TEMPERATURE", "0.2"))
 MAX_TOK    = int(os.getenv("CHAT_MAX_TOKENS", "800"))
 
+# One keep-alive session per process so repeated LM Studio calls reuse their
+# TCP connection instead of reconnecting per request.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def http_session():
+    """Shared requests.Session for LM Studio calls (requests is imported on first use)."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                sess = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                sess.mount("http://", adapter)
+                sess.mount("https://", adapter)
+                _SESSION = sess
+    return _SESSION
+
 def _post_chat(messages: List[Dict[str, str]], temperature: float = TEMP,
                max_tokens: int = MAX_TOK) -> Optional[str]:
     try:
-        import requests
-        r = requests.post(
+        r = http_session().post(
             f"{API_BASE}/chat/completions",
             headers={"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"},
             data=json.dumps({
@@ -24,7 +44,7 @@ def _post_chat(messages: List[Dict[str, str]], temperature: float = TEMP,
                 "max_tokens": max_tokens,
                 "stream": False
             }),
-            timeout=TIMEOUT_S,
+            timeout=(CONNECT_S, TIMEOUT_S),
         )
         r.raise_for_status()
         data = r.json()
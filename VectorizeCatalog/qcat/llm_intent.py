@@ -1,17 +1,24 @@
 # qcat/llm_intent.py
 from __future__ import annotations
-import os, re, json, requests
+import os, re, json, copy, hashlib, threading
+from pathlib import Path
+from collections import OrderedDict
 from typing import Dict, Optional, Any, List
 
 try:
     from .intents import list_intents, normalize_entity_name, detect_kind_from_words
+    from .llm import http_session
+    from .paths import OUTPUT_DIR
 except ImportError:
     from intents import list_intents, normalize_entity_name, detect_kind_from_words
+    from llm import http_session
+    from paths import OUTPUT_DIR
 
 # =============== LM Studio config ==================
 _LM_URL = os.getenv("QCAT_LMSTUDIO_URL", "http://127.0.0.1:1234/v1/chat/completions")
 _LM_MODEL = os.getenv("QCAT_LMSTUDIO_MODEL", "qwen2.5-32b-instruct")  # any model name LM Studio exposes
 _LM_TIMEOUT = float(os.getenv("QCAT_LMSTUDIO_TIMEOUT", "12"))
+_LM_CONNECT_TIMEOUT = float(os.getenv("QCAT_LMSTUDIO_CONNECT_TIMEOUT", "3"))
 _USE_LLM = os.getenv("QCAT_USE_LLM", "1").strip() not in ("0", "false", "False", "")
 
 _ALLOWED_INTENTS = set(list_intents())  # import from qcat.intents
@@ -221,7 +228,7 @@ def _lmstudio_classify(prompt: str) -> Optional[dict]:
             "max_tokens": 256,
             "stream": False,
         }
-        r = requests.post(_LM_URL, json=payload, timeout=_LM_TIMEOUT)
+        r = http_session().post(_LM_URL, json=payload, timeout=(_LM_CONNECT_TIMEOUT, _LM_TIMEOUT))
         r.raise_for_status()
         data = r.json()
         txt = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
@@ -241,6 +248,85 @@ def _lmstudio_classify(prompt: str) -> Optional[dict]:
     except Exception:
         return None
 
+# Recent LLM classifications keyed by (format version, model, prompt). Requests run at
+# temperature 0, so re-submitted prompts (e.g. accept_proposal re-runs) can
+# skip the round trip. Only successful LLM results are cached, and callers
+# always get a private copy since they annotate the returned dict.
+# webapp_lib.llm_intent shares this LRU under ("webapp", model, prompt) keys.
+_INTENT_CACHE_SIZE = int(os.getenv("QCAT_INTENT_CACHE_SIZE", "256"))
+# Cached entries are stored after parsing and normalization; bump this whenever
+# _safe_json_loads, _normalize_llm_fields or normalize_entity_name change output.
+_INTENT_CACHE_VERSION = 1
+_INTENT_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_INTENT_CACHE_LOCK = threading.Lock()
+
+def intent_cache_get(key: tuple) -> Optional[Dict[str, Any]]:
+    with _INTENT_CACHE_LOCK:
+        hit = _INTENT_CACHE.get(key)
+        if hit is None:
+            return None
+        _INTENT_CACHE.move_to_end(key)
+    return copy.deepcopy(hit)
+
+def intent_cache_put(key: tuple, obj: Dict[str, Any]) -> None:
+    if _INTENT_CACHE_SIZE <= 0:
+        return
+    with _INTENT_CACHE_LOCK:
+        _INTENT_CACHE[key] = copy.deepcopy(obj)
+        _INTENT_CACHE.move_to_end(key)
+        while len(_INTENT_CACHE) > _INTENT_CACHE_SIZE:
+            _INTENT_CACHE.popitem(last=False)
+
+# Opt-in on-disk layer under the in-process LRU, so repeated prompts survive
+# server restarts. Entries are keyed by format version + model + system prompt +
+# user prompt; editing _SYS or bumping _INTENT_CACHE_VERSION changes the key.
+_INTENT_DISK_CACHE = os.getenv("QCAT_INTENT_DISK_CACHE", "0").strip() not in ("0", "false", "False", "")
+_INTENT_DISK_DIR = Path(os.getenv("QCAT_INTENT_CACHE_DIR") or (OUTPUT_DIR / "intent_cache"))
+_INTENT_DISK_MAX = int(os.getenv("QCAT_INTENT_DISK_MAX", "2048"))
+_intent_disk_writes = 0
+
+def _intent_disk_path(key: tuple) -> Path:
+    version, model, prompt = key
+    h = hashlib.blake2b(f"{version}\x00{model}\x00{_SYS}\x00{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+    return _INTENT_DISK_DIR / f"{h}.json"
+
+def _intent_disk_get(key: tuple) -> Optional[Dict[str, Any]]:
+    if not _INTENT_DISK_CACHE:
+        return None
+    p = _intent_disk_path(key)
+    try:
+        obj = json.loads(p.read_text(encoding="utf-8"))
+        os.utime(p)  # mtime doubles as LRU recency for pruning
+    except (OSError, ValueError):
+        return None
+    return obj if isinstance(obj, dict) and obj.get("intent") in _ALLOWED_INTENTS else None
+
+def _intent_disk_put(key: tuple, obj: Dict[str, Any]) -> None:
+    global _intent_disk_writes
+    if not _INTENT_DISK_CACHE:
+        return
+    p = _intent_disk_path(key)
+    tmp = p.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _INTENT_DISK_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(obj), encoding="utf-8")
+        os.replace(tmp, p)  # atomic: readers never see a partial file
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+    _intent_disk_writes += 1
+    if _intent_disk_writes % 64 == 0:
+        _intent_disk_prune()
+
+def _intent_disk_prune() -> None:
+    """Drop least recently used entries beyond _INTENT_DISK_MAX."""
+    try:
+        files = sorted(_INTENT_DISK_DIR.glob("*.json"), key=lambda f: f.stat().st_mtime)
+    except OSError:
+        return
+    for f in files[:max(0, len(files) - _INTENT_DISK_MAX)]:
+        f.unlink(missing_ok=True)
+
 # =============== Public API ================================
 def classify_intent(prompt: str) -> Dict[str, Any]:
     """
@@ -249,10 +335,21 @@ def classify_intent(prompt: str) -> Dict[str, Any]:
 
     If LLM fails, returns low confidence so agent can show available commands.
     """
-    # Try LLM classification
-    llm = _lmstudio_classify(prompt)
-    if llm is not None:
-        return llm
+    # Try LLM classification (cached results are LLM output too, so skip them when it is off)
+    if _USE_LLM:
+        key = (_INTENT_CACHE_VERSION, _LM_MODEL, (prompt or "").strip())
+        cached = intent_cache_get(key)
+        if cached is not None:
+            return cached
+        cached = _intent_disk_get(key)
+        if cached is not None:
+            intent_cache_put(key, cached)
+            return cached
+        llm = _lmstudio_classify(prompt)
+        if llm is not None:
+            intent_cache_put(key, llm)
+            _intent_disk_put(key, llm)
+            return llm
 
     # LLM failed - return low confidence semantic fallback
     # Agent will handle showing available commands
@@ -2,6 +2,8 @@
 from __future__ import annotations
 import json
 import os
+import pickle
+import threading
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -23,7 +25,18 @@ except ImportError:
         SQL_EXPORTS_FUNCTIONS,
     )
 
-def _read_json(path: Path) -> Any:
+try:
+    import orjson  # optional: faster decode of catalog.json / clusters.json
+except ImportError:
+    orjson = None
+
+def read_json(path: Path) -> Any:
+    """Decode a UTF-8 JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which only the stdlib parser accepts
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -133,12 +146,90 @@ def _catalog_to_items(cat: Dict[str, Any]) -> List[Dict[str, Any]]:
             items.extend(_walk_group(kind, grp))
     return items
 
+_SECTION_KEYS = ("Tables", "Views", "Procedures", "Functions")
+_ENTITY_KEYS  = ("Schema", "Reads", "Writes")
+_REF_KEYS     = ("Schema", "Name")
+
+def _canon_keys(d: Dict[str, Any], keys) -> None:
+    """Move lowercase spellings (e.g. 'reads') to the canonical key ('Reads') in place."""
+    for k in keys:
+        lk = k.lower()
+        if lk in d:
+            v = d.pop(lk)
+            if not d.get(k):
+                d[k] = v
+
+def _canonicalize_catalog(cat: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize key spelling once at load so hot paths can read
+    catalog["Procedures"], obj["Reads"], ref["Name"] without case fallbacks.
+    """
+    if not isinstance(cat, dict):
+        return cat
+    _canon_keys(cat, _SECTION_KEYS)
+    for section in _SECTION_KEYS:
+        grp = cat.get(section)
+        if not isinstance(grp, dict):
+            continue
+        for obj in grp.values():
+            if not isinstance(obj, dict):
+                continue
+            _canon_keys(obj, _ENTITY_KEYS)
+            for lk in ("Reads", "Writes"):
+                for r in obj.get(lk) or []:
+                    if isinstance(r, dict):
+                        _canon_keys(r, _REF_KEYS)
+    return cat
+
+# Opt-in pickled copy of the canonicalized catalog next to catalog.json
+# (catalog.pkl). Unpickling runs code from that file, so only enable it when
+# the output directory is writable by trusted users alone. Snapshots are tagged
+# with the JSON's mtime/size and _CATALOG_SNAPSHOT_VERSION, so neither a
+# regenerated catalog nor a change to _canonicalize_catalog is shadowed.
+_CATALOG_SNAPSHOT = os.getenv("QCAT_CATALOG_SNAPSHOT", "0").strip() not in ("0", "false", "False", "")
+# Bump whenever _canonicalize_catalog changes what it produces.
+_CATALOG_SNAPSHOT_VERSION = 1
+
+def _snapshot_get(p: Path, src: tuple) -> Optional[Dict[str, Any]]:
+    if not _CATALOG_SNAPSHOT:
+        return None
+    try:
+        with p.with_suffix(".pkl").open("rb") as f:
+            snap = pickle.load(f)
+    except Exception:
+        # a corrupt or stale pickle can raise almost anything; fall back to JSON
+        return None
+    if (isinstance(snap, dict) and snap.get("version") == _CATALOG_SNAPSHOT_VERSION
+            and snap.get("src") == src and isinstance(snap.get("catalog"), dict)):
+        return snap["catalog"]
+    return None
+
+def _snapshot_put(p: Path, src: tuple, cat: Dict[str, Any]) -> None:
+    if not _CATALOG_SNAPSHOT or not isinstance(cat, dict):
+        return
+    snap = p.with_suffix(".pkl")
+    tmp = snap.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickle.dump({"version": _CATALOG_SNAPSHOT_VERSION, "src": src, "catalog": cat},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snap)  # atomic: readers never see a partial file
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
 @lru_cache(None)
 def load_catalog(path: Optional[str] = None) -> Dict[str, Any]:
     p = Path(path) if path else CATALOG_JSON
-    if not p.exists():
+    try:
+        st = p.stat()
+    except OSError:
         raise FileNotFoundError(f"catalog.json not found at {p}")
-    return _read_json(p)
+    src = (st.st_mtime_ns, st.st_size)
+    cat = _snapshot_get(p, src)
+    if cat is None:
+        cat = _canonicalize_catalog(read_json(p))
+        _snapshot_put(p, src, cat)
+    return cat
 
 @lru_cache(None)
 def load_items() -> List[Dict[str, Any]]:
@@ -1,6 +1,11 @@
 import re
 from typing import List, Tuple, Dict, Any
 
+try:
+    from .index_cache import cached_index
+except ImportError:
+    from index_cache import cached_index
+
 # Embeddings are no longer used in the current query flow
 # This module only uses deterministic name matching
 
@@ -26,8 +31,18 @@ def tokens_for(name: str) -> List[str]:
     return out
 
 # --- Quoted & kind detection ---
+_QUOTED_RE = re.compile(r"(?:'([^']+)')|(?:\"([^\"]+)\")|(?:\[((?:[^\]]|])+)\])|(?:`([^`]+)`)")
+_KIND_RES = (
+    (re.compile(r"\b(proc|procedure|stored procedure)s?\b"), "procedure"),
+    (re.compile(r"\bviews?\b"), "view"),
+    (re.compile(r"\btables?\b"), "table"),
+    (re.compile(r"\bcolumns?\b"), "column"),
+    (re.compile(r"\bfunctions?\b"), "function"),
+)
+_NON_WORD_RE = re.compile(r"[^A-Za-z0-9_]+")
+
 def extract_quoted_names(q: str) -> List[str]:
-    quoted = re.findall(r"(?:'([^']+)')|(?:\"([^\"]+)\")|(?:\[((?:[^\]]|])+)\])|(?:`([^`]+)`)", q)
+    quoted = _QUOTED_RE.findall(q)
     out = []
     for tup in quoted:
         for s in tup:
@@ -36,11 +51,8 @@ def extract_quoted_names(q: str) -> List[str]:
 
 def detect_kind(q: str):
     ql = q.lower()
-    if re.search(r"\b(proc|procedure|stored procedure)s?\b", ql): return "procedure"
-    if re.search(r"\bviews?\b", ql): return "view"
-    if re.search(r"\btables?\b", ql): return "table"
-    if re.search(r"\bcolumns?\b", ql): return "column"
-    if re.search(r"\bfunctions?\b", ql): return "function"
+    for rx, kind in _KIND_RES:
+        if rx.search(ql): return kind
     return None
 
 # --- Matching strategies ---
@@ -82,10 +94,23 @@ def matches_mode(hint: str, item: Dict[str, Any], mode: str) -> bool:
     # smart:
     return ranked_match_score(hint, item) is not None
 
+# --- Kind index ---
+def _build_kind_index(items: List[Dict[str, Any]]):
+    by_kind: Dict[str, List[Dict[str, Any]]] = {}
+    by_safe: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for it in items:
+        kind = it.get("kind")
+        by_kind.setdefault(kind, []).append(it)
+        by_safe.setdefault(kind, {})[it.get("safe_name")] = it
+    return by_kind, by_safe
+
+def kind_index(items: List[Dict[str, Any]]) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, Dict[str, Any]]]]:
+    """Items grouped by kind, and kind -> safe_name -> item, built once per items list."""
+    return cached_index(items, "kind_raw", _build_kind_index)
+
 # --- Candidate pickers ---
 def choose_candidates_by_kind(q: str, items: List[Dict[str, Any]], kind: str, k: int = 3, name_mode: str = "smart") -> List[str]:
-    inds = [i for i, it in enumerate(items) if it.get("kind") == kind]
-    kind_items = [items[i] for i in inds]
+    kind_items = kind_index(items)[0].get(kind, [])
     hints = extract_quoted_names(q)
     candidates: List[str] = []
 
@@ -113,7 +138,7 @@ def choose_candidates_by_kind(q: str, items: List[Dict[str, Any]], kind: str, k:
     # Falls through to token substring fallback below
 
     # token substring fallback
-    words = [w for w in re.split(r"[^A-Za-z0-9_]+", q) if w]
+    words = [w for w in _NON_WORD_RE.split(q) if w]
     for w in words:
         wl = w.lower()
         for it in kind_items:
@@ -133,7 +158,7 @@ def choose_proc_candidates(q, items, k=3, name_mode="smart"):
     return choose_candidates_by_kind(q, items, "procedure", k, name_mode)
 
 def all_tables_matching_hints(hints: List[str], items: List[Dict[str, Any]], name_mode: str) -> List[str]:
-    tables = [it for it in items if it.get("kind") == "table"]
+    tables = kind_index(items)[0].get("table", [])
     out: List[str] = []
     for h in hints:
         hl = h.lower()
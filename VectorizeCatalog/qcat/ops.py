@@ -2,11 +2,15 @@
 from __future__ import annotations
 from typing import List, Dict, Any, Optional, Tuple, Set, Iterable
 import re, difflib, html
+from functools import lru_cache
+from itertools import chain
 
 try:
     from .printers import read_sql_from_item
+    from .index_cache import cached_index
 except ImportError:
     from printers import read_sql_from_item
+    from index_cache import cached_index
 
 # Map kind -> section key in catalog.json
 _SECTION_BY_KIND = {
@@ -71,8 +75,10 @@ def as_items_list(obj) -> List[Dict[str, Any]]:
 
     # 3) If there's a nested 'catalog', use that as the source; otherwise use obj itself
     source = obj.get("catalog")
-    if not isinstance(source, dict):
-        source = obj
+    if isinstance(source, dict):
+        # Wrapper from load_items(): flatten its catalog once, without touching the wrapper
+        return cached_index(source, "items_list", as_items_list)
+    source = obj
 
     # 3a) If values already look like items (contain 'kind'), just return those values
     vals = list(source.values())
@@ -159,6 +165,17 @@ def as_items_list(obj) -> List[Dict[str, Any]]:
     return items
 
 
+def _build_kind_buckets(items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    buckets: Dict[str, List[Dict[str, Any]]] = {}
+    for it in items:
+        buckets.setdefault((it.get("kind") or "").lower(), []).append(it)
+    return buckets
+
+def _items_of_kind(items: List[Dict[str, Any]], kind: str) -> List[Dict[str, Any]]:
+    """Items of one kind (lowercased), grouped once per items list."""
+    return cached_index(items, "kind", _build_kind_buckets).get(kind, [])
+
+
 # -------------------- Name utilities --------------------
 
 def _strip_brackets(x: str) -> str:
@@ -168,9 +185,11 @@ def _strip_brackets(x: str) -> str:
     if x.startswith('"') and x.endswith('"'): return x[1:-1]
     return x
 
+_DOT_SPLIT_RE = re.compile(r"\s*\.\s*")
+
 def _split_qualified(name: str) -> Tuple[Optional[str], str]:
     s = (name or "").strip()
-    parts = [p.strip() for p in re.split(r"\s*\.\s*", s)]
+    parts = [p.strip() for p in _DOT_SPLIT_RE.split(s)]
     if len(parts) == 1:
         return None, _strip_brackets(parts[0])
     return _strip_brackets(parts[0]), _strip_brackets(parts[1])
@@ -224,51 +243,64 @@ def _names_for_match(it: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
         seen.add(ln); out.append(n)
     return schema, out
 
+def _build_name_index(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-kind lookup tables for _find_item, in item order:
+      base:  lowercased match name -> [(schema_lc, item)]
+      safe:  lowercased safe_name  -> first item
+      names: [(item, lowercased match names)] for fuzzy scans
+    """
+    out: Dict[str, Dict[str, Any]] = {}
+    for it in items:
+        ix = out.setdefault((it.get("kind") or "").lower(), {"base": {}, "safe": {}, "names": []})
+        s, cands = _names_for_match(it)
+        s_l = (s or "").lower()
+        lowered = tuple((nm or "").lower() for nm in cands)
+        for nm in dict.fromkeys(lowered):
+            ix["base"].setdefault(nm, []).append((s_l, it))
+        sname = (it.get("safe_name") or _ci_get(it, "Safe_Name") or "")
+        if isinstance(sname, str):
+            ix["safe"].setdefault(sname.lower(), it)
+        ix["names"].append((it, lowered))
+    return out
+
 def _find_item(items: List[Dict[str, Any]], kind: str, name: str, fuzzy: bool = False) -> Optional[Dict[str, Any]]:
     items = as_items_list(items)
     want_schema, want_base = _split_qualified(name)
     wl_schema = (want_schema or "").lower()
     wl_base   = (want_base or "").lower()
-    k_l = (kind or "").lower()
+    ix = cached_index(items, "name", _build_name_index).get((kind or "").lower())
+    if not ix:
+        return None
 
-    for it in items:
-        if (it.get("kind") or "").lower() != k_l:
-            continue
-        s, cands = _names_for_match(it)
-        if wl_schema and (s or "").lower() != wl_schema:
-            continue
-        for nm in cands:
-            if (nm or "").lower() == wl_base:
-                return it
+    for s_l, it in ix["base"].get(wl_base, ()):
+        if not wl_schema or s_l == wl_schema:
+            return it
 
     if wl_schema:
-        safe = _safe(want_schema, want_base).lower()
-        for it in items:
-            if (it.get("kind") or "").lower() != k_l:
-                continue
-            sname = (it.get("safe_name") or _ci_get(it, "Safe_Name") or "")
-            if isinstance(sname, str) and sname.lower() == safe:
-                return it
-            
-    if not wl_schema:
-        for it in items:
-            if (it.get("kind") or "").lower() != k_l:
-                continue
-            _s, cands = _names_for_match(it)
-            for nm in cands:
-                if (nm or "").lower() == wl_base:
-                    return it
+        it = ix["safe"].get(_safe(want_schema, want_base).lower())
+        if it is not None:
+            return it
 
     if fuzzy:
-        for it in items:
-            if (it.get("kind") or "").lower() != k_l:
-                continue
-            _s, cands = _names_for_match(it)
-            if any(wl_base in (nm or "").lower() for nm in cands):
+        for it, names in ix["names"]:
+            if any(wl_base in nm for nm in names):
                 return it
-            
+
     return None
 
+def warm_indexes(items) -> List[Dict[str, Any]]:
+    """
+    Build the per-items-list lookup indexes up front (kind buckets, name
+    index, Referenced_By reverse index) so the first queries, possibly
+    running concurrently, do not each build them. Returns the flat list.
+    """
+    items = as_items_list(items)
+    cached_index(items, "kind", _build_kind_buckets)
+    cached_index(items, "name", _build_name_index)
+    cached_index(items, "referenced_by", _build_referenced_by_index)
+    return items
+
 def find_item(
     items: Dict[str, Any],
     kind: str,
@@ -588,6 +620,23 @@ def tables_accessed_by_procedure(items: List[Dict[str, Any]], proc_name: str) ->
     writes = sorted({_normalize_ref_name(x) for x in _get_writes(it)})
     return reads, writes
 
+def _build_referenced_by_index(items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Referencing object safe name -> tables whose Referenced_By lists it (each table once)."""
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for t in _items_of_kind(items, "table"):
+        for e in _ci_get(t, "Referenced_By") or []:
+            if not isinstance(e, dict): continue
+            sname = e.get("Safe_Name")
+            if not sname:
+                continue
+            if "·" not in sname:
+                sch = e.get("Schema") or ""
+                sname = _safe(sch, sname) if sch else sname
+            tables = index.setdefault(sname, [])
+            if not tables or tables[-1] is not t:
+                tables.append(t)
+    return index
+
 def tables_accessed_by_view(items: List[Dict[str, Any]], view_name: str) -> List[str]:
     items = as_items_list(items)
     view = _find_item(items, "view", view_name, fuzzy=False)
@@ -601,21 +650,8 @@ def tables_accessed_by_view(items: List[Dict[str, Any]], view_name: str) -> List
         schema = view.get("schema") or _ci_get(view, "Schema") or ""
         nm = view.get("name") or _ci_get(view, "Original_Name") or _ci_get(view, "Safe_Name")
         if nm: this_safe = _safe(schema, nm) if schema else nm
-    out = []
-    for t in items:
-        if (t.get("kind") or "").lower() != "table":
-            continue
-        for e in _ci_get(t, "Referenced_By") or []:
-            if not isinstance(e, dict): continue
-            sname = e.get("Safe_Name")
-            if not sname:
-                continue
-            if "·" not in sname:
-                sch = e.get("Schema") or ""
-                sname = _safe(sch, sname) if sch else sname
-            if sname == this_safe:
-                out.append(_as_display(t))
-                break
+    referenced = cached_index(items, "referenced_by", _build_referenced_by_index)
+    out = [_as_display(t) for t in referenced.get(this_safe, [])]
     out.sort(key=lambda s: s.lower())
     return out
 
@@ -623,24 +659,19 @@ def unaccessed_tables(items: List[Dict[str, Any]]) -> List[str]:
     items = as_items_list(items)
     referenced: Set[str] = set()
 
-    for it in items:
-        kind = (it.get("kind") or "").lower()
-        if kind in ("procedure","view"):
-            for r in _get_reads(it):
-                referenced.add(_normalize_ref_name(r).lower())
-            for w in _get_writes(it):
-                referenced.add(_normalize_ref_name(w).lower())
+    for it in chain(_items_of_kind(items, "procedure"), _items_of_kind(items, "view")):
+        for r in _get_reads(it):
+            referenced.add(_normalize_ref_name(r).lower())
+        for w in _get_writes(it):
+            referenced.add(_normalize_ref_name(w).lower())
 
     unused = []
-    for t in items:
-        if (t.get("kind") or "").lower() != "table":
+    for t in _items_of_kind(items, "table"):
+        if _ci_get(t, "Referenced_By"):
+            # it's referenced explicitly somewhere
             continue
         name = _as_display(t)
-        refs = _ci_get(t, "Referenced_By") or []
         _, base = _split_qualified(name)
-        if refs:
-            # it's referenced explicitly somewhere
-            continue
         if base.lower() in referenced:
             continue
         unused.append(name)
@@ -780,14 +811,13 @@ def columns_returned_by_procedure(items: List[Dict[str, Any]], proc_name: str) -
                 resolved_table = table_map.get(table_ref.lower())
 
                 if isinstance(columns, (list, set)):
-                    for col in columns:
-                        if resolved_table:
-                            # Format: schema.TableName.ColumnName (convert · to .)
-                            table_display = resolved_table.replace("·", ".")
-                            qualified_cols.append(f"{table_display}.{col}")
-                        else:
-                            # Can't resolve - just use the column name
-                            qualified_cols.append(str(col))
+                    if resolved_table:
+                        # Format: schema.TableName.ColumnName (convert · to .)
+                        table_display = resolved_table.replace("·", ".")
+                        qualified_cols.extend(f"{table_display}.{col}" for col in columns)
+                    else:
+                        # Can't resolve - just use the column name
+                        qualified_cols.extend(str(col) for col in columns)
 
             cols = sorted(set(qualified_cols), key=lambda s: s.lower())
 
@@ -863,6 +893,46 @@ def get_sql(items: List[Dict[str, Any]], kind: Optional[str], name: str):
     sql, src = read_sql_from_item(it)
     return sql, src, _as_display(it)
 
+def _hunk_range(start: int, length: int) -> str:
+    """Hunk range in the same form difflib emits ('1', '1,5', '0,0')."""
+    if length == 1:
+        return f"{start + 1}"
+    return f"{start + 1 if length else start},{length}"
+
+def _full_context_diff(a: List[str], b: List[str], fromfile: str, tofile: str) -> List[str]:
+    """
+    Single-hunk unified diff covering both files entirely. Common
+    leading/trailing lines are emitted as context directly and the matcher
+    only runs on the differing middle, so the result is a valid full-context
+    diff but not always identical to difflib.unified_diff(n=max(len(a), len(b))):
+    the middle may be aligned differently.
+    """
+    if a == b:
+        return []
+    lo, hi_a, hi_b = 0, len(a), len(b)
+    while lo < hi_a and lo < hi_b and a[lo] == b[lo]:
+        lo += 1
+    while hi_a > lo and hi_b > lo and a[hi_a - 1] == b[hi_b - 1]:
+        hi_a -= 1
+        hi_b -= 1
+
+    out = [f"--- {fromfile}", f"+++ {tofile}",
+           f"@@ -{_hunk_range(0, len(a))} +{_hunk_range(0, len(b))} @@"]
+    out.extend(" " + ln for ln in a[:lo])
+    mid_a, mid_b = a[lo:hi_a], b[lo:hi_b]
+    if not mid_a or not mid_b:
+        out.extend("-" + ln for ln in mid_a)
+        out.extend("+" + ln for ln in mid_b)
+    else:
+        for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, mid_a, mid_b).get_opcodes():
+            if tag == "equal":
+                out.extend(" " + ln for ln in mid_a[i1:i2])
+                continue
+            out.extend("-" + ln for ln in mid_a[i1:i2])
+            out.extend("+" + ln for ln in mid_b[j1:j2])
+    out.extend(" " + ln for ln in a[hi_a:])
+    return out
+
 def unified_diff(left_name: str,
                  left_sql: str,
                  right_name: str,
@@ -882,30 +952,32 @@ def unified_diff(left_name: str,
     b = rs.splitlines()
 
     if context == "full":
-        n = max(len(a), len(b))
-    elif isinstance(context, int):
-        n = max(0, context)
+        raw = _full_context_diff(a, b, f"a/{left_name}", f"b/{right_name}")
     else:
-        n = 3
-
-    raw = list(difflib.unified_diff(
-        a, b,
-        fromfile=f"a/{left_name}",
-        tofile=f"b/{right_name}",
-        n=n,
-    ))
-
-    norm = [ln.rstrip("\r\n") for ln in raw]
+        n = max(0, context) if isinstance(context, int) else 3
+        raw = list(difflib.unified_diff(
+            a, b,
+            fromfile=f"a/{left_name}",
+            tofile=f"b/{right_name}",
+            n=n,
+            lineterm="",
+        ))
+
+    # Inputs are already LF-normalized, so only strip when a stray CR survived.
+    norm: Iterable[str] = raw
+    if any("\r" in ln for ln in raw):
+        norm = (ln.rstrip("\r\n") for ln in raw)
 
     if ensure_git_header:
-        if not norm or not norm[0].startswith("--- "):
-            norm = [f"--- a/{left_name}", f"+++ b/{right_name}"] + norm
+        if not raw or not raw[0].startswith("--- "):
+            norm = chain((f"--- a/{left_name}", f"+++ b/{right_name}"), norm)
 
     body = "\n".join(norm)
-    if not body.endswith("\n"):
-        body += "\n"
-
-    return f"diff --git a/{left_name} b/{right_name}\n{body}"
+    return "".join((
+        f"diff --git a/{left_name} b/{right_name}\n",
+        body,
+        "" if body.endswith("\n") else "\n",
+    ))
 
 
 _ID = r"(?:\[[^\]]+\]|[A-Za-z_][A-Za-z0-9_]*)"
@@ -915,30 +987,36 @@ def _token_set(s: str) -> Set[str]:
     return {t.lower() for t in TOK.findall(s or "")}
 
 def _table_struct_from_item(it: Dict[str, Any]) -> Dict[str, Any]:
-    cols = _extract_columns_from_item(it)
-    colset = { (c.get("name") or "").lower() for c in cols if c.get("name") }
-    types = { (c.get("name") or "").lower(): (c.get("type") or "").lower() for c in cols if c.get("name") }
+    colset: Set[str] = set()
+    types: Dict[str, str] = {}
+    for c in _extract_columns_from_item(it):
+        n = (c.get("name") or "").lower()
+        if not n:
+            continue
+        colset.add(n)
+        types[n] = (c.get("type") or "").lower()
     pk = set(map(str.lower, _ci_get(it, "Primary_Key") or []))
-    idxs = set()
+    idxs: Set[Tuple[str, str]] = set()
     idx_obj = _ci_get(it, "Indexes") or {}
     if isinstance(idx_obj, dict):
-        for iname, ccols in idx_obj.items():
-            if isinstance(ccols, list):
-                for c in ccols: idxs.add((str(iname).lower(), (c or "").lower()))
+        idxs = {
+            (str(iname).lower(), (c or "").lower())
+            for iname, ccols in idx_obj.items() if isinstance(ccols, list)
+            for c in ccols
+        }
     return {"columns": colset, "types": types, "pk": pk, "idx": idxs}
 
-def similarity_sql(items: List[Dict[str, Any]],
-                   left_it: Optional[Dict[str, Any]],
-                   right_it: Optional[Dict[str, Any]],
-                   left_norm: str, right_norm: str) -> Dict[str, Any]:
+def _similarity_scores(left_norm: str, right_norm: str,
+                       left_cols: Optional[Set[str]] = None,
+                       right_cols: Optional[Set[str]] = None) -> Dict[str, Any]:
+    """Score two normalized SQL texts; column sets (tables only) add a structure term."""
     edit = difflib.SequenceMatcher(None, left_norm, right_norm).ratio()
     ls, rs = _token_set(left_norm), _token_set(right_norm)
     inter = len(ls & rs); uni = max(1, len(ls | rs))
     token_sim = inter / uni
     structure_sim = None
-    if left_it and right_it and (left_it.get("kind") or "").lower()=="table" and (right_it.get("kind") or "").lower()=="table":
-        lt, rt = _table_struct_from_item(left_it), _table_struct_from_item(right_it)
-        c_inter = len(lt["columns"] & rt["columns"]); c_uni = max(1, len(lt["columns"] | rt["columns"]))
+    if left_cols is not None and right_cols is not None:
+        c_inter = len(left_cols & right_cols); c_uni = max(1, len(left_cols | right_cols))
         structure_sim = c_inter / c_uni
     if structure_sim is not None:
         overall = 0.45*edit + 0.35*token_sim + 0.20*structure_sim
@@ -951,13 +1029,26 @@ def similarity_sql(items: List[Dict[str, Any]],
         "structure": (round(structure_sim*100,1) if structure_sim is not None else None),
     }
 
+def similarity_sql(items: List[Dict[str, Any]],
+                   left_it: Optional[Dict[str, Any]],
+                   right_it: Optional[Dict[str, Any]],
+                   left_norm: str, right_norm: str) -> Dict[str, Any]:
+    left_cols = right_cols = None
+    if left_it and right_it and (left_it.get("kind") or "").lower()=="table" and (right_it.get("kind") or "").lower()=="table":
+        left_cols = _table_struct_from_item(left_it)["columns"]
+        right_cols = _table_struct_from_item(right_it)["columns"]
+    return _similarity_scores(left_norm, right_norm, left_cols, right_cols)
+
 def compare_sql(items: List[Dict[str, Any]],
                 left_kind: Optional[str], left_name: str,
-                right_kind: Optional[str], right_name: str) -> Dict[str, Any]:
+                right_kind: Optional[str], right_name: str,
+                unified_diff_cap: int = 2000) -> Dict[str, Any]:
     """
     Compare two entities' CREATE SQL.
     Uses get_sql() so it works whether SQL is on disk exports or in the index.
     Also computes a similarity score and a unified diff string (for diff2html).
+    The diff carries full-file context unless either side exceeds
+    `unified_diff_cap` lines, in which case only 5 lines around each change are kept.
     """
     items = as_items_list(items)
 
@@ -971,9 +1062,10 @@ def compare_sql(items: List[Dict[str, Any]],
         if not r_it: missing.append(f"`{right_name}`")
         return {"answer": f"Cannot compare: not found {', '.join(missing)}."}
 
-    # Fetch SQL via helper (returns sql, source, display)
-    l_sql, _, l_disp = get_sql(items, left_kind, left_name)
-    r_sql, _, r_disp = get_sql(items, right_kind, right_name)
+    # Fetch SQL for the already-resolved entities (same as get_sql, minus re-resolving)
+    l_sql, _ = read_sql_from_item(l_it)
+    r_sql, _ = read_sql_from_item(r_it)
+    l_disp, r_disp = _as_display(l_it), _as_display(r_it)
 
     # If both missing, bail out early
     if not l_sql and not r_sql:
@@ -983,14 +1075,21 @@ def compare_sql(items: List[Dict[str, Any]],
     l_fmt = format_sql_for_diff(l_sql or "")
     r_fmt = format_sql_for_diff(r_sql or "")
     
-    sim   = similarity_sql(items, l_it, r_it, l_fmt, r_fmt)
+    # Table structures feed both the similarity score and the summary below
+    both_tables = (l_it.get("kind") or "").lower() == "table" and (r_it.get("kind") or "").lower() == "table"
+    lt = _table_struct_from_item(l_it) if both_tables else None
+    rt = _table_struct_from_item(r_it) if both_tables else None
+    sim   = _similarity_scores(l_fmt, r_fmt,
+                               lt["columns"] if lt else None,
+                               rt["columns"] if rt else None)
     # udiff = unified_diff(l_disp, l_fmt, r_disp, r_fmt, context=3)
-    udiff = unified_diff(l_disp, l_fmt, r_disp, r_fmt, context="full")
+    max_lines = max(l_fmt.count("\n"), r_fmt.count("\n")) + 1
+    context = 5 if max_lines > unified_diff_cap else "full"
+    udiff = unified_diff(l_disp, l_fmt, r_disp, r_fmt, context=context)
 
     # Optional structural summary if they are tables
     summary_lines = []
-    if (l_it.get("kind") or "").lower() == "table" and (r_it.get("kind") or "").lower() == "table":
-        lt, rt = _table_struct_from_item(l_it), _table_struct_from_item(r_it)
+    if lt and rt:
         added = sorted([c for c in rt["columns"] if c not in lt["columns"]])
         removed = sorted([c for c in lt["columns"] if c not in rt["columns"]])
         changed = []
@@ -1051,7 +1150,8 @@ def find_similar_sql(items: List[Dict[str, Any]],
         return []
 
     source_kind = (source_it.get("kind") or "").lower()
-    source_sql, _, source_disp = get_sql(items, kind, name)
+    source_sql, _ = read_sql_from_item(source_it)
+    source_disp = _as_display(source_it)
 
     if not source_sql:
         return []
@@ -1060,7 +1160,11 @@ def find_similar_sql(items: List[Dict[str, Any]],
     source_fmt = format_sql_for_diff(source_sql)
 
     # Find all entities of the same kind
-    candidates = [it for it in items if (it.get("kind") or "").lower() == source_kind]
+    candidates = _items_of_kind(items, source_kind)
+
+    # Column sets feed the structure term when comparing tables
+    is_table = source_kind == "table"
+    source_cols = _table_struct_from_item(source_it)["columns"] if is_table else None
 
     # Compare each candidate with the source
     results = []
@@ -1078,9 +1182,8 @@ def find_similar_sql(items: List[Dict[str, Any]],
 
         # Format and compute similarity
         candidate_fmt = format_sql_for_diff(candidate_sql)
-        sim = similarity_sql(items, source_it, candidate_it, source_fmt, candidate_fmt)
-
-        similarity_score = sim["overall"]
+        candidate_cols = _table_struct_from_item(candidate_it)["columns"] if is_table else None
+        similarity_score = _similarity_scores(source_fmt, candidate_fmt, source_cols, candidate_cols)["overall"]
 
         # Only include if above threshold
         if similarity_score >= threshold:
@@ -1126,23 +1229,33 @@ _KW_SEQ = [
     r'\bAS\b',
 ]
 
+_KW_RES = [re.compile(p, re.IGNORECASE) for p in _KW_SEQ]
+
+def _kw_break(m: "re.Match[str]") -> str:
+    i = m.start()
+    return ("\n" if i == 0 or m.string[i - 1] != "\n" else "") + m.group(0)
+
 def _newline_around_keywords(s: str) -> str:
     """
     Put each keyword on its own line (case-insensitive).
     Ensures a line break BEFORE the keyword if not already at bol.
     """
-    for pat in _KW_SEQ:
-        s = re.sub(pat, lambda m: ("\n" if not s[:m.start()].endswith("\n") else "") + m.group(0), s, flags=re.IGNORECASE)
+    for rx in _KW_RES:
+        s = rx.sub(_kw_break, s)
     return s
 
+_COMMA_BREAK_RE = re.compile(r",(?!\s*\n)")
+_SEMI_BREAK_RE  = re.compile(r";(?!\s*\n)")
+_PAREN_SPLIT_RE = re.compile(r"([()])")
+
 def _newline_after_commas_semicolons(s: str) -> str:
     """
     Helpful for long SET/SELECT lists: break after commas/semicolons unless already newline.
     """
     # comma followed by optional space that is not already newline -> comma + newline
-    s = re.sub(r",(?!\s*\n)", ",\n", s)
+    s = _COMMA_BREAK_RE.sub(",\n", s)
     # semicolon ends a statement
-    s = re.sub(r";(?!\s*\n)", ";\n", s)
+    s = _SEMI_BREAK_RE.sub(";\n", s)
     return s
 
 def _indent_parentheses(s: str, indent: str = "  ") -> str:
@@ -1150,7 +1263,7 @@ def _indent_parentheses(s: str, indent: str = "  ") -> str:
     Put every '(' and ')' on its own line and indent the content between them.
     This is a simple structural formatter (not a full SQL parser).
     """
-    parts = re.split(r"([()])", s)
+    parts = _PAREN_SPLIT_RE.split(s)
     out_lines = []
     level = 0
 
@@ -1266,16 +1379,19 @@ def _iter_names_from_items(items, kind: str):
         fq = name
         yield fq
 
+@lru_cache(maxsize=256)
+def _compile_name_pattern(pattern: str) -> "re.Pattern[str]":
+    return re.compile(pattern, re.I)
+
 def list_all_of_kind(items, kind: str, schema: str | None = None, name_pattern: str | None = None):
     """Generic lister used by all list_all_* wrappers."""
-    import re
     names = list(_iter_names_from_items(items, kind))
     if schema:
         wl_schema = schema.lower().strip("[]")
-        names = [n for n in names if (n.split(".", 1)[0].lower().strip("[]") == wl_schema)]
+        names = [n for n in names if (n.partition(".")[0].lower().strip("[]") == wl_schema)]
     if name_pattern:
-        rx = re.compile(name_pattern, re.I)
-        names = [n for n in names if rx.search(n.split(".", 1)[-1])]
+        rx = _compile_name_pattern(name_pattern)
+        names = [n for n in names if rx.search(n.partition(".")[2] or n)]
     return sorted(names, key=str.casefold)
 
 def list_all_tables(items, schema: str | None = None, name_pattern: str | None = None, pattern: str | None = None):
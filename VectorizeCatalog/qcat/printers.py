@@ -1,7 +1,12 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, Iterable
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+import mmap
+import os
 import re
+import threading
 
 try:
     from .paths import OUTPUT_DIR, SQL_FILES_DIR
@@ -43,6 +48,7 @@ def _qualified_alts(schema: Optional[str], base: str) -> str:
     sch_any = r"(?:\[[A-Za-z0-9_]+\]|\"[A-Za-z0-9_]+\"|`[A-Za-z0-9_]+`|[A-Za-z0-9_]+)"
     return rf"(?:{sch_any}\s*\.\s*{base_alt}|{base_alt})"
 
+@lru_cache(maxsize=512)
 def _ddl_pattern(kind: str, schema: Optional[str], base: str) -> re.Pattern:
     obj = _qualified_alts(schema, base)
     if kind == "table":
@@ -61,25 +67,111 @@ def _slice_to_next_go(text: str, start: int) -> str:
     m = _GO_RE.search(text, pos=start)
     return text[start:].strip() if not m else text[start:m.start()].strip()
 
+# The sql_files listing is kept with the mtime of every directory in the tree.
+# Adding, removing or renaming a file bumps its directory's mtime, so the tree
+# is re-walked only when one of those stamps moves.
+_sql_files_cache: Tuple[Optional[tuple], List[Path]] = (None, [])
+
+def _dir_stamps(dirs: Iterable[str]) -> Optional[tuple]:
+    try:
+        return tuple((d, os.stat(d).st_mtime_ns) for d in dirs)
+    except OSError:
+        return None  # a directory vanished: force a re-walk
+
+def _sql_files() -> List[Path]:
+    global _sql_files_cache
+    stamps, files = _sql_files_cache
+    if stamps is None or _dir_stamps(d for d, _ in stamps) != stamps:
+        # stamp before listing, so changes made during the walk trigger the next one
+        stamps = _dir_stamps(root for root, _, _ in os.walk(SQL_FILES_DIR)) or None
+        files = sorted(SQL_FILES_DIR.rglob("*.sql"))
+        _sql_files_cache = (stamps, files)
+    return files
+
+# Decoded file text, one entry per path (replaced when its mtime moves), evicted
+# least recently used once the cached text exceeds _SQL_TEXT_CACHE_CHARS.
+_SQL_TEXT_CACHE_CHARS = int(os.getenv("QCAT_SQL_TEXT_CACHE_CHARS", str(16 * 1024 * 1024)))
+_sql_text_cache: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+_sql_text_chars = 0
+_sql_text_lock = threading.Lock()
+
+def _read_sql_text(path: str, mtime_ns: int) -> str:
+    global _sql_text_chars
+    with _sql_text_lock:
+        hit = _sql_text_cache.get(path)
+        if hit is not None and hit[0] == mtime_ns:
+            _sql_text_cache.move_to_end(path)
+            return hit[1]
+    txt = Path(path).read_text(encoding="utf-8", errors="ignore")
+    if len(txt) > _SQL_TEXT_CACHE_CHARS:
+        return txt
+    with _sql_text_lock:
+        old = _sql_text_cache.pop(path, None)
+        if old is not None:
+            _sql_text_chars -= len(old[1])
+        _sql_text_cache[path] = (mtime_ns, txt)
+        _sql_text_chars += len(txt)
+        while _sql_text_chars > _SQL_TEXT_CACHE_CHARS:
+            _, (_, evicted) = _sql_text_cache.popitem(last=False)
+            _sql_text_chars -= len(evicted)
+    return txt
+
+# Non-ASCII characters that str patterns with re.I fold onto these ASCII letters.
+_FOLD_ALTS = {
+    "i": ("\u0130", "\u0131"),
+    "k": ("\u212a",),
+    "s": ("\u017f",),
+}
+
+@lru_cache(maxsize=512)
+def _name_needle(base: str) -> Optional[re.Pattern]:
+    """Case-insensitive bytes pattern for the base name (ASCII names only)."""
+    if not base or not base.isascii():
+        return None
+    parts = []
+    for ch in base:
+        alts = _FOLD_ALTS.get(ch.lower())
+        esc = re.escape(ch.encode("ascii"))
+        if alts:
+            esc = b"(?:" + b"|".join([esc] + [re.escape(a.encode("utf-8")) for a in alts]) + b")"
+        parts.append(esc)
+    return re.compile(b"".join(parts), re.I)
+
+def _file_mentions(p: Path, needle: re.Pattern) -> bool:
+    """Cheap byte-level prefilter over an mmap of the file; True when unsure."""
+    try:
+        with open(p, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return needle.search(mm) is not None
+    except (OSError, ValueError):
+        return True
+
 def _search_sources_for(kind: str, schema: Optional[str], base: str) -> Tuple[Optional[str], Optional[str]]:
     """Scan ../sql_files recursively; return (ddl_text, source_path) if found."""
     pat = _ddl_pattern(kind, schema, base)
+    # try without schema if provided (sometimes sources omit it)
+    pat2 = _ddl_pattern(kind, None, base) if schema else None
     if not SQL_FILES_DIR.exists():
         return None, None
-    for p in sorted(SQL_FILES_DIR.rglob("*.sql")):
+    # Every DDL match contains the base name verbatim, so files without it
+    # are skipped before decoding or running the full regex.
+    needle = _name_needle(base)
+    for p in _sql_files():
         try:
-            txt = p.read_text(encoding="utf-8", errors="ignore")
+            st = p.stat()
+            if not st.st_size:
+                continue
+            if needle is not None and not _file_mentions(p, needle):
+                continue
+            txt = _read_sql_text(str(p), st.st_mtime_ns)
         except Exception:
             continue
         m = pat.search(txt)
         if not m:
-            # try without schema if provided (sometimes sources omit it)
-            if schema:
-                pat2 = _ddl_pattern(kind, None, base)
-                m = pat2.search(txt)
-                if not m:
-                    continue
-            else:
+            if pat2 is None:
+                continue
+            m = pat2.search(txt)
+            if not m:
                 continue
         snippet = _slice_to_next_go(txt, m.start())
         if snippet:
@@ -88,17 +180,20 @@ def _search_sources_for(kind: str, schema: Optional[str], base: str) -> Tuple[Op
 
 # ---------- export path guesser (handles middle-dot vs dot, spaces vs underscores, etc.) ----------
 
+_NON_ID_RE   = re.compile(r"[^A-Za-z0-9_]")
+_MULTI_US_RE = re.compile(r"_+")
+
 def _sanitize_base_variants(base: str) -> Iterable[str]:
     """Generate plausible base filename variants used by exporters."""
     yield base
     if " " in base:
         yield base.replace(" ", "_")
     # replace any non [A-Za-z0-9_] (keep underscore)
-    cleaned = re.sub(r"[^A-Za-z0-9_]", "_", base)
+    cleaned = _NON_ID_RE.sub("_", base)
     if cleaned != base:
         yield cleaned
     # collapse multiple underscores
-    collapsed = re.sub(r"_+", "_", cleaned)
+    collapsed = _MULTI_US_RE.sub("_", cleaned)
     if collapsed != cleaned:
         yield collapsed
 
@@ -8,6 +8,7 @@ try:
         choose_table_candidates,
         all_tables_matching_hints,
         choose_proc_candidates,
+        kind_index,
     )
     from .dynamic_sql import proc_hits_table
 except ImportError:
@@ -18,6 +19,7 @@ except ImportError:
         choose_table_candidates,
         all_tables_matching_hints,
         choose_proc_candidates,
+        kind_index,
     )
     from dynamic_sql import proc_hits_table
 
@@ -26,8 +28,8 @@ def _refs_contains_table(lst, tbl_safe: str) -> bool:
         rsafe = r.get("Safe_Name")
         if rsafe and rsafe.lower() == tbl_safe.lower():
             return True
-        rsch = r.get("Schema") or r.get("schema") or ""
-        rnm  = r.get("Name") or r.get("name") or ""
+        rsch = r.get("Schema") or ""
+        rnm  = r.get("Name") or ""
         combo = (rsch + "·" + rnm) if rsch else rnm
         if combo.lower() == tbl_safe.lower():
             return True
@@ -47,11 +49,10 @@ def procs_accessing_table(
     sections: list of {title, results: [{item, access}]}
     """
     catalog = load_catalog()
-    procs  = catalog.get("Procedures") or catalog.get("procedures") or {}
-    views  = catalog.get("Views") or catalog.get("views") or {}
+    procs  = catalog.get("Procedures") or {}
+    views  = catalog.get("Views") or {}
 
-    proc_item_by_safe = {it.get("safe_name"): it for it in items if it.get("kind") == "procedure"}
-    table_items = [it for it in items if it.get("kind") == "table"]
+    proc_item_by_safe = kind_index(items)[1].get("procedure", {})
 
     hints = [forced_table] if forced_table else extract_quoted_names(query)
     if forced_table and "·" in forced_table:
@@ -67,12 +68,12 @@ def procs_accessing_table(
     view_reads_map: Dict[str, List[str]] = {}
     if include_via_views:
         for vsafe, vobj in views.items():
-            reads = vobj.get("Reads") or vobj.get("reads") or []
+            reads = vobj.get("Reads") or []
             for r in reads:
                 rsafe = r.get("Safe_Name")
                 if not rsafe:
-                    s = r.get("Schema") or r.get("schema") or ""
-                    n = r.get("Name") or r.get("name") or ""
+                    s = r.get("Schema") or ""
+                    n = r.get("Name") or ""
                     rsafe = (s + "·" + n) if s else n
                 if rsafe:
                     view_reads_map.setdefault(rsafe, []).append(vsafe)
@@ -93,8 +94,8 @@ def procs_accessing_table(
         results = []
 
         for psafe, pobj in procs.items():
-            reads  = pobj.get("Reads") or pobj.get("reads") or []
-            writes = pobj.get("Writes") or pobj.get("writes") or []
+            reads  = pobj.get("Reads") or []
+            writes = pobj.get("Writes") or []
             state = []
             if _refs_contains_table(reads, tbl_safe):  state.append("READ")
             if _refs_contains_table(writes, tbl_safe): state.append("WRITE")
@@ -103,8 +104,8 @@ def procs_accessing_table(
                 for r in reads:
                     rsafe = r.get("Safe_Name")
                     if not rsafe:
-                        s = r.get("Schema") or r.get("schema") or ""
-                        n = r.get("Name") or r.get("name") or ""
+                        s = r.get("Schema") or ""
+                        n = r.get("Name") or ""
                         rsafe = (s + "·" + n) if s else n
                     if rsafe and rsafe in via_views:
                         state.append("READ(via view)")
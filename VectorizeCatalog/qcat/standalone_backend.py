@@ -13,16 +13,19 @@ try:
     from .items import load_items
     from .paths import BASE, OUTPUT_DIR, ITEMS_JSON
     from .agent import agent_answer
+    from .backend import remember
 except ImportError:
     from items import load_items
     from paths import BASE, OUTPUT_DIR, ITEMS_JSON
     from agent import agent_answer
+    from backend import remember
 
 app = FastAPI()
 
 # In-memory session storage for entity memory
-# session_id -> {tables: set, procedures: set, views: set, functions: set}
-SESSION_MEMORY: Dict[str, Dict[str, set]] = {}
+# session_id -> {tables: [...], procedures: [...], views: [...], functions: [...]}
+# Each bucket is kept sorted and unique, so responses need no re-sort.
+SESSION_MEMORY: Dict[str, Dict[str, List[str]]] = {}
 
 app.add_middleware(
     CORSMiddleware,
@@ -126,10 +129,10 @@ def api_ask(body: AskBody):
     # Initialize session memory if needed
     if session_id not in SESSION_MEMORY:
         SESSION_MEMORY[session_id] = {
-            "tables": set(),
-            "procedures": set(),
-            "views": set(),
-            "functions": set()
+            "tables": [],
+            "procedures": [],
+            "views": [],
+            "functions": []
         }
 
     # Get answer from agent
@@ -148,14 +151,14 @@ def api_ask(body: AskBody):
         if kind and name:
             plural = kind + "s"  # table->tables, procedure->procedures, etc
             if plural in SESSION_MEMORY[session_id]:
-                SESSION_MEMORY[session_id][plural].add(name)
+                remember(SESSION_MEMORY[session_id][plural], name)
 
     # Return memory alongside answer
     memory = {
-        "tables": sorted(SESSION_MEMORY[session_id]["tables"]),
-        "procedures": sorted(SESSION_MEMORY[session_id]["procedures"]),
-        "views": sorted(SESSION_MEMORY[session_id]["views"]),
-        "functions": sorted(SESSION_MEMORY[session_id]["functions"])
+        "tables": list(SESSION_MEMORY[session_id]["tables"]),
+        "procedures": list(SESSION_MEMORY[session_id]["procedures"]),
+        "views": list(SESSION_MEMORY[session_id]["views"]),
+        "functions": list(SESSION_MEMORY[session_id]["functions"])
     }
 
     return {**out, "session_id": session_id, "memory": memory}
@@ -166,10 +169,10 @@ def clear_memory(body: Dict[str, Any]):
     session_id = body.get("session_id")
     if session_id and session_id in SESSION_MEMORY:
         SESSION_MEMORY[session_id] = {
-            "tables": set(),
-            "procedures": set(),
-            "views": set(),
-            "functions": set()
+            "tables": [],
+            "procedures": [],
+            "views": [],
+            "functions": []
         }
         return {"ok": True, "message": "Memory cleared"}
     return {"ok": False, "message": "Session not found"}
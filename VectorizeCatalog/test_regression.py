@@ -9,18 +9,24 @@ Run with: python3 test_regression.py
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Every query must reach LM Studio: never answer from the on-disk intent cache
+os.environ["QCAT_INTENT_DISK_CACHE"] = "0"
+
 # Import unified webapp agent
 from webapp_lib.agent import agent_answer
 
 # Import backend services
 from qcat.items import load_items
+from qcat.ops import warm_indexes
 from qcat.backend import QcatService
 from cluster.backend import ClusterService
 from qcat.paths import OUTPUT_DIR
@@ -307,12 +313,68 @@ TEST_CASES = [
 ]
 
 
-def run_tests(catalog_path: str = None) -> None:
+def run_one(test: Dict[str, Any], qcat_service: Any, cluster_service: Any) -> Tuple[str, List[str]]:
+    """
+    Run a single test case.
+
+    Returns (status, lines) where status is "passed", "failed" or "error" and
+    lines is the report to print, so concurrent runs can print in test order.
+    """
+    query = test["query"]
+    validate = test["validate"]
+    lines: List[str] = []
+
+    try:
+        # Get answer using unified agent
+        result = agent_answer(
+            query=query,
+            qcat_service=qcat_service,
+            cluster_service=cluster_service,
+            intent_override=None,
+            accept_proposal=False
+        )
+
+        # Check if needs confirmation (low confidence)
+        if result.get("needs_confirmation"):
+            lines.append(f"  ⚠️  NEEDS CONFIRMATION - Low confidence intent classification")
+            lines.append(f"     Proposal: {result.get('proposal', {}).get('intent')}")
+            return "failed", lines
+
+        # FIRST: Validate result structure (critical for webapp.py compatibility)
+        structure_ok, structure_msg = validate_result_structure(result)
+        if not structure_ok:
+            lines.append(f"  ❌ FAILED - Structure validation: {structure_msg}")
+            lines.append(f"     Result keys: {list(result.keys())}")
+            if "entities" in result:
+                lines.append(f"     Entities type: {type(result['entities'])}")
+            return "failed", lines
+
+        # SECOND: Validate answer content (business logic)
+        answer = result.get("answer", "")
+        validation_ok, validation_msg = validate(answer)
+
+        # Overall result
+        if validation_ok:
+            lines.append(f"  ✅ PASSED - {validation_msg} | {structure_msg}")
+            return "passed", lines
+        lines.append(f"  ❌ FAILED - {validation_msg}")
+        lines.append(f"     Answer preview: {answer[:200]}...")
+        return "failed", lines
+
+    except Exception as e:
+        import traceback
+        lines.append(f"  ❌ ERROR: {e}")
+        lines.append(traceback.format_exc().rstrip())
+        return "error", lines
+
+
+def run_tests(catalog_path: str = None, workers: int = 4) -> None:
     """
     Run all regression tests using unified webapp agent.
 
     Note: catalog_path parameter is kept for backward compatibility but not used.
     The services load data from paths.py configuration (OUTPUT_DIR, etc).
+    workers sets how many tests run concurrently (1 = serial).
     """
 
     # Initialize backend services
@@ -322,6 +384,8 @@ def run_tests(catalog_path: str = None) -> None:
         print("  Loading qcat items...")
         ITEMS, EMB = load_items()
         qcat_service = QcatService(ITEMS, EMB)
+        # Build the lookup indexes once, before concurrent tests race to do it
+        warm_indexes(ITEMS)
 
         # Load cluster service
         print("  Loading cluster service...")
@@ -346,60 +410,21 @@ def run_tests(catalog_path: str = None) -> None:
     print("RUNNING REGRESSION TESTS")
     print("=" * 80)
 
-    for i, test in enumerate(TEST_CASES, 1):
-        name = test["name"]
-        query = test["query"]
-        expected_intent = test.get("expected_intent")
-        validate = test["validate"]
-
-        print(f"\n[{i}/{len(TEST_CASES)}] {name}")
-        print(f"  Query: {query}")
-
-        try:
-            # Get answer using unified agent
-            result = agent_answer(
-                query=query,
-                qcat_service=qcat_service,
-                cluster_service=cluster_service,
-                intent_override=None,
-                accept_proposal=False
-            )
-
-            # Check if needs confirmation (low confidence)
-            if result.get("needs_confirmation"):
-                print(f"  ⚠️  NEEDS CONFIRMATION - Low confidence intent classification")
-                print(f"     Proposal: {result.get('proposal', {}).get('intent')}")
-                failed += 1
-                continue
-
-            # FIRST: Validate result structure (critical for webapp.py compatibility)
-            structure_ok, structure_msg = validate_result_structure(result)
-            if not structure_ok:
-                print(f"  ❌ FAILED - Structure validation: {structure_msg}")
-                print(f"     Result keys: {list(result.keys())}")
-                if "entities" in result:
-                    print(f"     Entities type: {type(result['entities'])}")
-                failed += 1
-                continue
-
-            # SECOND: Validate answer content (business logic)
-            answer = result.get("answer", "")
-            validation_ok, validation_msg = validate(answer)
-
-            # Overall result
-            if validation_ok:
-                print(f"  ✅ PASSED - {validation_msg} | {structure_msg}")
+    # Tests are I/O-bound (LM Studio round trips), so run them on a thread
+    # pool; results come back in test order and are printed as they arrive.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        outcomes = pool.map(lambda t: run_one(t, qcat_service, cluster_service), TEST_CASES)
+        for i, (test, (status, lines)) in enumerate(zip(TEST_CASES, outcomes), 1):
+            print(f"\n[{i}/{len(TEST_CASES)}] {test['name']}")
+            print(f"  Query: {test['query']}")
+            for line in lines:
+                print(line)
+            if status == "passed":
                 passed += 1
-            else:
-                print(f"  ❌ FAILED - {validation_msg}")
-                print(f"     Answer preview: {answer[:200]}...")
+            elif status == "failed":
                 failed += 1
-
-        except Exception as e:
-            print(f"  ❌ ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            errors += 1
+            else:
+                errors += 1
 
     # Summary
     print("\n" + "=" * 80)
@@ -431,6 +456,12 @@ if __name__ == "__main__":
         "--test",
         help="Run only tests matching this name (substring match)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of tests to run concurrently (1 = serial)"
+    )
 
     args = parser.parse_args()
 
@@ -441,4 +472,4 @@ if __name__ == "__main__":
         TEST_CASES.extend(filtered)
         print(f"Running {len(TEST_CASES)} tests matching '{args.test}'")
 
-    run_tests(args.catalog)
+    run_tests(args.catalog, workers=args.workers)
@@ -14,7 +14,7 @@ from pathlib import Path
 # Import qcat components
 from qcat.items import load_items
 from qcat.paths import BASE, OUTPUT_DIR, ITEMS_JSON
-from qcat.backend import QcatService
+from qcat.backend import QcatService, remember
 
 # Import cluster backend components
 from cluster.backend import ClusterService, ClusterState
@@ -54,7 +54,8 @@ CLUSTER_SNAPSHOT_PATH = OUTPUT_DIR / "cluster" / "clusters.json"
 CLUSTER_SERVICE = ClusterService(CLUSTER_SNAPSHOT_PATH)
 
 # Session memory for qcat
-SESSION_MEMORY: Dict[str, Dict[str, set]] = {}
+# Each bucket is kept sorted and unique, so responses need no re-sort.
+SESSION_MEMORY: Dict[str, Dict[str, List[str]]] = {}
 
 # ============================================================================
 # ROOT - Serve unified UI
@@ -99,8 +100,8 @@ def qcat_ask(body: AskBody):
 
     if session_id not in SESSION_MEMORY:
         SESSION_MEMORY[session_id] = {
-            "tables": set(), "procedures": set(),
-            "views": set(), "functions": set()
+            "tables": [], "procedures": [],
+            "views": [], "functions": []
         }
 
     # Use qcat agent directly for this endpoint
@@ -120,9 +121,9 @@ def qcat_ask(body: AskBody):
         if kind and name:
             plural = kind + "s"
             if plural in SESSION_MEMORY[session_id]:
-                SESSION_MEMORY[session_id][plural].add(name)
+                remember(SESSION_MEMORY[session_id][plural], name)
 
-    memory = {k: sorted(v) for k, v in SESSION_MEMORY[session_id].items()}
+    memory = {k: list(v) for k, v in SESSION_MEMORY[session_id].items()}
     return {**out, "session_id": session_id, "memory": memory}
 
 @app.post("/api/qcat/clear_memory")
@@ -131,8 +132,8 @@ def qcat_clear_memory(body: Dict[str, Any]):
     session_id = body.get("session_id")
     if session_id and session_id in SESSION_MEMORY:
         SESSION_MEMORY[session_id] = {
-            "tables": set(), "procedures": set(),
-            "views": set(), "functions": set()
+            "tables": [], "procedures": [],
+            "views": [], "functions": []
         }
         return {"ok": True, "message": "Memory cleared"}
     return {"ok": False, "message": "Session not found"}
@@ -262,8 +263,8 @@ def unified_command(body: UnifiedCommand):
 
         if session_id not in SESSION_MEMORY:
             SESSION_MEMORY[session_id] = {
-                "tables": set(), "procedures": set(),
-                "views": set(), "functions": set()
+                "tables": [], "procedures": [],
+                "views": [], "functions": []
             }
 
         # Check if this is a list_all_* intent (should not populate entity memory)
@@ -276,9 +277,9 @@ def unified_command(body: UnifiedCommand):
                 if kind and name:
                     plural = kind + "s"
                     if plural in SESSION_MEMORY[session_id]:
-                        SESSION_MEMORY[session_id][plural].add(name)
+                        remember(SESSION_MEMORY[session_id][plural], name)
 
-        memory = {k: sorted(v) for k, v in SESSION_MEMORY[session_id].items()}
+        memory = {k: list(v) for k, v in SESSION_MEMORY[session_id].items()}
         result["session_id"] = session_id
         result["memory"] = memory
 
@@ -7,12 +7,13 @@ Uses LLM to classify user query into the correct backend + intent.
 from __future__ import annotations
 import os
 import json
-import requests
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Import intents from both backends
 from cluster.intents import INTENTS as CLUSTER_INTENTS, INTENT_LABELS as CLUSTER_LABELS
 from qcat.intents import INTENTS as QCAT_INTENTS, INTENT_LABELS as QCAT_LABELS, normalize_entity_name
+from qcat.llm import http_session
+from qcat.llm_intent import intent_cache_get, intent_cache_put
 
 # LM Studio configuration
 _LM_URL = os.getenv("WEBAPP_LMSTUDIO_URL", os.getenv("QCAT_LMSTUDIO_URL", "http://127.0.0.1:1234/v1/chat/completions"))
@@ -167,7 +168,7 @@ def _lmstudio_classify(prompt: str) -> Dict[str, Any] | None:
             "stream": False,
         }
         # print(f"[webapp.llm_intent] Calling LM Studio at {_LM_URL}")
-        r = requests.post(_LM_URL, json=payload, timeout=_LM_TIMEOUT)
+        r = http_session().post(_LM_URL, json=payload, timeout=_LM_TIMEOUT)
         r.raise_for_status()
         data = r.json()
         txt = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
@@ -198,9 +199,14 @@ def classify_intent(prompt: str) -> Dict[str, Any]:
 
     If LLM fails, returns low confidence so agent can show available commands.
     """
-    # Try LLM classification
+    # Try LLM classification; the LRU is shared with qcat, so keys carry a "webapp" tag
+    key = ("webapp", _LM_MODEL, (prompt or "").strip())
+    cached = intent_cache_get(key)
+    if cached is not None:
+        return cached
     llm = _lmstudio_classify(prompt)
     if llm is not None:
+        intent_cache_put(key, llm)
         return llm
 
     # LLM failed - return low confidence fallback